@@ -1,6 +1,6 @@
 from torch.utils.data import Dataset, DataLoader
 import pandas as pd
-import random
+import numpy as np
 import torch
 import os
 
@@ -8,61 +8,85 @@ from .dataloader import Dataloader
 
 
 def complete_batch(df, batch_size):
-    complete_bins = []
-    bins = [bin_df for _, bin_df in df.groupby('bin')]
+    sizes = df.groupby('bin').size()
+    pads = (-sizes) % batch_size
 
-    for gr_id, bin in enumerate(bins):
-        l = len(bin)
-        remainder = l % batch_size
-        integer = l // batch_size
+    if not pads.any():
+        # every bin already divides evenly: no padding to insert, a stable
+        # sort by bin is enough to lay the rows out in batch runs
+        return df.sort_values('bin', kind='stable', ignore_index=True)
 
-        if remainder != 0:
-            # take the first example and copy (batch_size - remainder) times
-            bin = pd.concat([bin, pd.concat([bin.iloc[:1]] * (batch_size - remainder))], ignore_index=True)
-            integer += 1
-        batch_ids = []
-        # create indices
-        for i in range(integer):
-            batch_ids.extend([f'{i}_bin{gr_id}'] * batch_size)
-        bin['batch_id'] = batch_ids
-        complete_bins.append(bin)
-    return pd.concat(complete_bins, ignore_index=True)
+    # pad each bin to a multiple of batch_size by repeating its first example,
+    # then gather all rows with a single take instead of per-bin concats
+    padded_indices = []
+    for bin_id, indices in df.groupby('bin').indices.items():
+        pad = pads[bin_id]
+        if pad:
+            indices = np.concatenate([indices, np.full(pad, indices[0], dtype=np.int64)])
+        padded_indices.append(indices)
 
+    # the returned rows are laid out in contiguous runs of batch_size sharing
+    # a bin, which shuffle_batches and the batch pre-building rely on
+    return df.take(np.concatenate(padded_indices)).reset_index(drop=True)
 
-def shuffle_batches(df):
-    batch_bins = [df_new for _, df_new in df.groupby('batch_id')]
-    random.shuffle(batch_bins)
-    return pd.concat(batch_bins).reset_index(drop=True)
 
+def shuffle_batches(df, batch_size):
+    # complete_batch lays the rows out in contiguous runs of batch_size, so
+    # shuffling batches is a permutation of those runs - no groupby, no concat
+    n_batches = len(df) // batch_size
+    perm = np.random.permutation(n_batches)
+    row_indices = (perm[:, None] * batch_size + np.arange(batch_size)).ravel()
+    return df.take(row_indices).reset_index(drop=True)
 
-def concater_collate(batch):
-    (xx, yy, lengths, bins) = zip(*batch)
-    xx = torch.cat(xx, 0)
-    yy = torch.tensor(yy)
-    return xx, yy, list(lengths), list(bins)
+
+def batch_collate(batch):
+    # batches are pre-built by TaxonomyDatasetCreator, so the DataLoader runs
+    # with batch_size=1 and the collate just unwraps the singleton list
+    return batch[0]
 
 
 class TaxonomyDatasetCreator(Dataset):
-    def __init__(self, df, batch_size, var_len=False):
+    def __init__(self, data, offsets, df, batch_size, var_len=False):
         if var_len:
             df = complete_batch(df=df, batch_size=batch_size)
-            self.df = shuffle_batches(df=df)[['sequence', 'label', 'len', 'bin']]
-        else:
-            self.df = df
+            df = shuffle_batches(df=df, batch_size=batch_size)
+
+        self.data = data
+        self.offsets = offsets
+
+        rows = df['row'].to_numpy()
+        labels = torch.as_tensor(df['label'].values)
+        lengths = df['len'].to_numpy()
+        bins = df['bin'].to_numpy()
+
+        # keep only row indices per batch; the sequences stay in the
+        # memory-mapped buffer and are gathered with one concatenation per
+        # served batch, so pages are touched lazily and shared across workers
+        self.batches = []
+        for start in range(0, len(df), batch_size):
+            end = start + batch_size
+            self.batches.append((
+                rows[start:end],
+                labels[start:end],
+                list(lengths[start:end]),
+                list(bins[start:end])
+            ))
 
     def __getitem__(self, index):
-        X, Y, length, bin = self.df.iloc[index, :]
-        Y = torch.tensor(Y)
-        X = torch.from_numpy(X)
-        return X, Y, length, bin
+        rows, labels, lengths, bins = self.batches[index]
+        sequences = np.concatenate(
+            [self.data[self.offsets[row]:self.offsets[row + 1]] for row in rows]
+        )
+        return torch.from_numpy(sequences).long(), labels, lengths, bins
 
     def __len__(self):
-        return len(self.df)
+        return len(self.batches)
 
 
 class VEPDatasetCreator(Dataset):
     def __init__(self, dataframe):
-        self.dataframe = dataframe
+        # hold only the column arrays; keeping the DataFrame alive would copy
+        # its whole block manager into every forked loader worker
         self.reference = dataframe["reference"].values
         self.alternate = dataframe["alternate"].values
         self.tissue = dataframe["tissue"].values
@@ -72,66 +96,133 @@ class VEPDatasetCreator(Dataset):
         return self.reference[index], self.alternate[index], self.tissue[index], self.label[index]
 
     def __len__(self):
-        return len(self.dataframe)
+        return len(self.label)
 
 
 class PlantDeepSeaDatasetCreator(Dataset):
     def __init__(self, df, batch_size, var_len=False):
+        target_list = df.columns.tolist()[:-3]
         if var_len:
-            target_list = df.columns.tolist()[:-3]
             df = complete_batch(df=df, batch_size=batch_size)
-            columns = ['sequence', 'len', 'bin'] + target_list
-            self.df = shuffle_batches(df=df)[columns]
-            self.targets = self.df[target_list].values
-        else:
-            self.df = df
+            df = shuffle_batches(df=df, batch_size=batch_size)
+
+        # flatten the object-dtype sequence column into one contiguous uint8
+        # buffer with offsets; one ndarray per row costs an object header each
+        # and scatters reads across the heap
+        sequences = df['sequence'].values
+        sequence_lengths = np.array([len(sequence) for sequence in sequences], dtype=np.int64)
+        self.offsets = np.zeros(len(sequence_lengths) + 1, dtype=np.int64)
+        self.offsets[1:] = np.cumsum(sequence_lengths)
+        self.data = np.concatenate(sequences).astype(np.uint8)
+
+        # keep targets as one float tensor so __getitem__ slices it instead
+        # of building a tensor per sample
+        self.targets = torch.as_tensor(df[target_list].values, dtype=torch.float32)
+        self.lengths = df['len'].to_numpy()
+        self.bins = df['bin'].to_numpy()
 
     def __getitem__(self, index):
-        X = self.df.iloc[index]['sequence']
-        length = self.df.iloc[index]['len']
-        bin = self.df.iloc[index]['bin']
-        Y = torch.FloatTensor(self.targets[index])
-        X = torch.from_numpy(X)
-        return X, Y, length, bin
+        X = torch.from_numpy(self.data[self.offsets[index]:self.offsets[index + 1]]).long()
+        return X, self.targets[index], self.lengths[index], self.bins[index]
 
     def __len__(self):
-        return len(self.df)
+        return len(self.lengths)
+
+
+# loaded datasets keyed by file path, so every create_dataloader call for the
+# same split in this process reuses the data instead of re-reading it
+_dataset_cache = {}
 
 
 class ChordMixerDataLoader(Dataloader):
+    def load_taxonomy_archive(self, data_path):
+        """
+        Load the memory-mapped taxonomy archive, building it from the csv on
+        the first run
+
+        Args:
+            data_path: path to the raw csv file
+
+        Returns:
+            tuple of the mmap'd sequence buffer, the offsets array and a
+            dataframe with the per-sequence metadata
+        """
+        sequence_path = data_path.replace(".csv", ".seq.npy")
+        metadata_path = data_path.replace(".csv", ".meta.npz")
+
+        if not (os.path.exists(sequence_path) and os.path.exists(metadata_path)):
+            dataframe = pd.read_csv(data_path)
+            dataframe = self.process_taxonomy_classification_dataframe(dataframe, "ChordMixer")
+            lengths = np.array([len(sequence) for sequence in dataframe["sequence"].values], dtype=np.int64)
+            offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+            offsets[1:] = np.cumsum(lengths)
+            np.save(sequence_path, np.concatenate(dataframe["sequence"].values).astype(np.uint8))
+            np.savez(
+                metadata_path,
+                offsets=offsets,
+                label=dataframe["label"].to_numpy(),
+                len=dataframe["len"].to_numpy(),
+                bin=dataframe["bin"].to_numpy()
+            )
+
+        data = np.load(sequence_path, mmap_mode="r")
+        metadata = np.load(metadata_path)
+        dataframe = pd.DataFrame({
+            "row": np.arange(len(metadata["label"])),
+            "label": metadata["label"],
+            "len": metadata["len"],
+            "bin": metadata["bin"]
+        })
+        return data, metadata["offsets"], dataframe
+
     def create_dataloader(self):
         data_path = os.path.join(self.data_path, self.dataset_filename)
-        dataframe = pd.read_csv(data_path)
 
         if self.dataset_type == "TaxonomyClassification":
-            dataframe = self.process_taxonomy_classification_dataframe(dataframe, "ChordMixer")
+            if data_path not in _dataset_cache:
+                _dataset_cache[data_path] = self.load_taxonomy_archive(data_path)
+            data, offsets, dataframe = _dataset_cache[data_path]
             dataset = TaxonomyDatasetCreator(
+                data=data,
+                offsets=offsets,
                 df=dataframe,
                 batch_size=self.batch_size,
                 var_len=True
             )
             return DataLoader(
                 dataset,
-                batch_size=self.batch_size,
+                batch_size=1,
                 shuffle=False,
-                collate_fn=concater_collate,
-                drop_last=False
+                collate_fn=batch_collate,
+                drop_last=False,
+                num_workers=1,
+                persistent_workers=True,
+                pin_memory=True
             )
 
         elif self.dataset_type == "VariantEffectPrediction":
-            dataframe = self.process_variant_effect_prediction_dataframe(dataframe, "ChordMixer")
-            dataset = VEPDatasetCreator(dataframe)
+            if data_path not in _dataset_cache:
+                _dataset_cache[data_path] = self.process_variant_effect_prediction_dataframe(
+                    pd.read_csv(data_path), "ChordMixer"
+                )
+            dataset = VEPDatasetCreator(_dataset_cache[data_path])
             return DataLoader(
                 dataset,
                 batch_size=self.batch_size,
                 shuffle=True,
-                drop_last=False
+                drop_last=False,
+                num_workers=1,
+                persistent_workers=True,
+                pin_memory=True
             )
 
         elif self.dataset_type == "PlantDeepSEA":
-            dataframe = self.process_plantdeepsea_dataframe(dataframe, "ChordMixer")
+            if data_path not in _dataset_cache:
+                _dataset_cache[data_path] = self.process_plantdeepsea_dataframe(
+                    pd.read_csv(data_path), "ChordMixer"
+                )
             dataset = PlantDeepSeaDatasetCreator(
-                df=dataframe,
+                df=_dataset_cache[data_path],
                 batch_size=self.batch_size,
                 var_len=True
             )
@@ -139,7 +230,10 @@ class ChordMixerDataLoader(Dataloader):
                 dataset,
                 batch_size=self.batch_size,
                 shuffle=False,
-                drop_last=False
+                drop_last=False,
+                num_workers=1,
+                persistent_workers=True,
+                pin_memory=True
             )
 
         else:
@@ -9,20 +9,22 @@ from .dataloader import Dataloader
 
 class PlantDeepSeaDatasetCreator(Dataset):
     def __init__(self, df):
-        self.df = df
         target_list = df.columns.tolist()[:-3]
-        self.targets = self.df[target_list].values
+        # hold only the column arrays; keeping the DataFrame alive would copy
+        # its whole block manager into every forked loader worker
+        self.sequences = df['sequence'].values
+        # keep targets as one float tensor so __getitem__ slices it instead
+        # of building a tensor per sample
+        self.targets = torch.as_tensor(df[target_list].values, dtype=torch.float32)
+        self.lengths = df['len'].to_numpy()
+        self.bins = df['bin'].to_numpy()
 
     def __getitem__(self, index):
-        X = self.df.iloc[index]['sequence']
-        length = self.df.iloc[index]['len']
-        bin = self.df.iloc[index]['bin']
-        Y = torch.FloatTensor(self.targets[index])
-        X = torch.from_numpy(X)
-        return X, Y, length, bin
+        X = torch.from_numpy(self.sequences[index])
+        return X, self.targets[index], self.lengths[index], self.bins[index]
 
     def __len__(self):
-        return len(self.df)
+        return len(self.lengths)
 
 
 class CNNDataLoader(Dataloader):
@@ -27,10 +27,9 @@ class Linformer(nn.Module):
         self.linear = nn.Linear(2, embedding_size, bias=True)
 
     def forward(self, x):
-        x = self.encoder(x)
-        positions = torch.arange(0, self.const_vector_length).expand(x.size(0), self.const_vector_length).to(
-            self.device)
-        x = self.posenc(positions) + x
+        # position ids are always 0..L-1, so the positional table broadcasts in
+        # directly; add_ avoids materializing a second (batch, L, dim) temporary
+        x = self.encoder(x).add_(self.posenc.weight)
         x = self.linformermodel(x)
         if self.pooling == 'avg':
             x = torch.mean(x, 1)
@@ -1,5 +1,4 @@
 from tqdm import tqdm
-from sklearn import metrics
 import torch
 
 from .trainer import Trainer
@@ -7,6 +6,14 @@ from .trainer import Trainer
 
 class ChordMixerTrainer(Trainer):
 
+    def __init__(self, model, train_dataloader, val_dataloader, test_dataloader, device, criterion, optimizer, task):
+        super().__init__(model, train_dataloader, val_dataloader, test_dataloader, device, criterion, optimizer, task)
+        # mixed precision on cuda: prefer bf16 (no loss scaling needed), fall
+        # back to fp16 with a GradScaler on older GPUs
+        self.amp_enabled = "cuda" in str(device)
+        self.amp_dtype = torch.bfloat16 if self.amp_enabled and torch.cuda.is_bf16_supported() else torch.float16
+        self.scaler = torch.cuda.amp.GradScaler(enabled=self.amp_enabled and self.amp_dtype == torch.float16)
+
     def calculate_y_hat(self, data: tuple) -> tuple:
         """
         Calculate the y_hat for the given data and task
@@ -19,8 +26,8 @@ class ChordMixerTrainer(Trainer):
         """
         if self.task == "TaxonomyClassification":
             x, y, seq_len, bin = data
-            x = x.to(self.device)
-            y = y.to(self.device)
+            x = x.to(self.device, non_blocking=True)
+            y = y.to(self.device, non_blocking=True)
             model_input = {
                 "task": self.task,
                 "x": x,
@@ -31,10 +38,10 @@ class ChordMixerTrainer(Trainer):
 
         elif self.task == "VariantEffectPrediction":
             x1, x2, tissue, y = data
-            x1 = x1.to(self.device)
-            x2 = x2.to(self.device)
-            tissue = tissue.to(self.device)
-            y = y.to(self.device).float()
+            x1 = x1.to(self.device, non_blocking=True)
+            x2 = x2.to(self.device, non_blocking=True)
+            tissue = tissue.to(self.device, non_blocking=True)
+            y = y.to(self.device, non_blocking=True).float()
             model_input = {
                 "task": self.task,
                 "x1": x1,
@@ -46,8 +53,8 @@ class ChordMixerTrainer(Trainer):
 
         elif self.task == "PlantDeepSEA":
             x, y, seq_len, bin = data
-            x = x.to(self.device)
-            y = y.to(self.device)
+            x = x.to(self.device, non_blocking=True)
+            y = y.to(self.device, non_blocking=True)
             model_input = {
                 "task": self.task,
                 "x": x
@@ -100,39 +107,43 @@ class ChordMixerTrainer(Trainer):
 
         num_batches = len(self.train_dataloader)
 
-        running_loss = 0.0
+        # scalar kept on device; read back once per epoch to avoid a sync per step
+        running_loss = torch.zeros(1, device=self.device)
         correct = 0
         total = 0
 
         preds = []
         targets = []
 
-        loop = tqdm(self.train_dataloader, total=num_batches)
+        # description set once; per-iteration postfix formatting is measurable
+        # overhead on short steps, and the metrics are logged at epoch end
+        loop = tqdm(self.train_dataloader, total=num_batches, desc=f'Epoch {current_epoch_nr}')
         for batch in loop:
-            y, y_hat = self.calculate_y_hat(batch)
+            with torch.autocast(device_type="cuda", dtype=self.amp_dtype, enabled=self.amp_enabled):
+                y, y_hat = self.calculate_y_hat(batch)
 
-            loss = self.criterion(y_hat, y)
-            loss.backward()
-            self.optimizer.step()
-            self.optimizer.zero_grad()
+            # BCELoss is unsafe to autocast and raises on cuda, so the loss is
+            # computed outside the region on fp32 outputs
+            loss = self.criterion(y_hat.float(), y)
 
-            running_loss += loss.item()
+            self.scaler.scale(loss).backward()
+            self.scaler.step(self.optimizer)
+            self.scaler.update()
+            self.optimizer.zero_grad(set_to_none=True)
+
+            running_loss += loss.detach()
 
             predicted, correct_predictions = self.calculate_predictions(y, y_hat)
 
             correct += correct_predictions
             total += y.size(0)
 
-            targets.extend(y.detach().cpu().numpy())
-            preds.extend(predicted.detach().cpu().numpy())
-
-            loop.set_description(f'Epoch {current_epoch_nr}')
-            loop.set_postfix(train_acc=round(correct / total, 3),
-                             train_loss=round(running_loss / total, 3))
+            targets.append(y.detach())
+            preds.append(predicted.detach())
 
-        train_auc = metrics.roc_auc_score(targets, preds)
+        train_auc = self.compute_auc(targets, preds)
         train_accuracy = correct / total
-        train_loss = running_loss / num_batches
+        train_loss = running_loss.item() / num_batches
 
         self.log_metrics(
             auc=train_auc,
@@ -156,7 +167,8 @@ class ChordMixerTrainer(Trainer):
 
         num_batches = len(self.val_dataloader)
 
-        running_loss = 0.0
+        # scalar kept on device; read back once per epoch to avoid a sync per step
+        running_loss = torch.zeros(1, device=self.device)
         correct = 0
         total = 0
 
@@ -164,29 +176,28 @@ class ChordMixerTrainer(Trainer):
         targets = []
 
         with torch.no_grad():
-            loop = tqdm(self.val_dataloader, total=num_batches)
+            loop = tqdm(self.val_dataloader, total=num_batches, desc=f'Epoch {current_epoch_nr}')
             for batch in loop:
-                y, y_hat = self.calculate_y_hat(batch)
+                with torch.autocast(device_type="cuda", dtype=self.amp_dtype, enabled=self.amp_enabled):
+                    y, y_hat = self.calculate_y_hat(batch)
 
-                loss = self.criterion(y_hat, y)
+                # BCELoss is unsafe to autocast and raises on cuda, so the loss
+                # is computed outside the region on fp32 outputs
+                loss = self.criterion(y_hat.float(), y)
 
-                running_loss += loss.item()
+                running_loss += loss.detach()
 
                 predicted, correct_predictions = self.calculate_predictions(y, y_hat)
 
                 correct += correct_predictions
                 total += y.size(0)
 
-                targets.extend(y.detach().cpu().numpy())
-                preds.extend(predicted.detach().cpu().numpy())
-
-                loop.set_description(f'Epoch {current_epoch_nr}')
-                loop.set_postfix(val_acc=round(correct / total, 3),
-                                 val_loss=round(running_loss / total, 3))
+                targets.append(y.detach())
+                preds.append(predicted.detach())
 
-        val_auc = metrics.roc_auc_score(targets, preds)
+        val_auc = self.compute_auc(targets, preds)
         validation_accuracy = correct / total
-        validation_loss = running_loss / num_batches
+        validation_loss = running_loss.item() / num_batches
 
         self.log_metrics(
             auc=val_auc,
@@ -204,7 +215,8 @@ class ChordMixerTrainer(Trainer):
 
         num_batches = len(self.test_dataloader)
 
-        running_loss = 0.0
+        # scalar kept on device; read back once per epoch to avoid a sync per step
+        running_loss = torch.zeros(1, device=self.device)
         correct = 0
         total = 0
 
@@ -212,29 +224,28 @@ class ChordMixerTrainer(Trainer):
         targets = []
 
         with torch.no_grad():
-            loop = tqdm(self.test_dataloader, total=num_batches)
+            loop = tqdm(self.test_dataloader, total=num_batches, desc='Testing')
             for batch in loop:
-                y, y_hat = self.calculate_y_hat(batch)
+                with torch.autocast(device_type="cuda", dtype=self.amp_dtype, enabled=self.amp_enabled):
+                    y, y_hat = self.calculate_y_hat(batch)
 
-                loss = self.criterion(y_hat, y)
+                # BCELoss is unsafe to autocast and raises on cuda, so the loss
+                # is computed outside the region on fp32 outputs
+                loss = self.criterion(y_hat.float(), y)
 
-                running_loss += loss.item()
+                running_loss += loss.detach()
 
                 predicted, correct_predictions = self.calculate_predictions(y, y_hat)
 
                 correct += correct_predictions
                 total += y.size(0)
 
-                targets.extend(y.detach().cpu().numpy())
-                preds.extend(predicted.detach().cpu().numpy())
-
-                loop.set_description('Testing')
-                loop.set_postfix(test_acc=round(correct / total, 3),
-                                 test_loss=round(running_loss / total, 3))
+                targets.append(y.detach())
+                preds.append(predicted.detach())
 
-        test_auc = metrics.roc_auc_score(targets, preds)
+        test_auc = self.compute_auc(targets, preds)
         test_accuracy = correct / total
-        test_loss = running_loss / num_batches
+        test_loss = running_loss.item() / num_batches
 
         self.log_metrics(
             auc=test_auc,
@@ -103,7 +103,7 @@ class CNNTrainer(Trainer):
             loss = self.criterion(y_hat, y)
             loss.backward()
             self.optimizer.step()
-            self.optimizer.zero_grad()
+            self.optimizer.zero_grad(set_to_none=True)
 
             running_loss += loss.item()
 
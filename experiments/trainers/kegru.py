@@ -29,7 +29,7 @@ class KeGruTrainer(Trainer):
 
             loss = torch.nn.functional.binary_cross_entropy(y_hat, y)
 
-            self.optimizer.zero_grad()
+            self.optimizer.zero_grad(set_to_none=True)
             loss.backward()
             self.optimizer.step()
 
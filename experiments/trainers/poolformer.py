@@ -31,7 +31,7 @@ class PoolformerTrainer(Trainer):
             loss.backward()
 
             self.optimizer.step()
-            self.optimizer.zero_grad()
+            self.optimizer.zero_grad(set_to_none=True)
 
             running_loss += loss.item()
 
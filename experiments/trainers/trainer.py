@@ -1,10 +1,14 @@
 from abc import ABC
+from sklearn import metrics
+import torch
 import wandb
 
 
 class Trainer(ABC):
     def __init__(self, model, train_dataloader, val_dataloader, test_dataloader, device, criterion, optimizer, task):
-        self.model = model
+        # compile once up front where available (torch >= 2.0); older torch
+        # falls back to the eager model
+        self.model = torch.compile(model) if hasattr(torch, "compile") else model
         self.train_dataloader = train_dataloader
         self.val_dataloader = val_dataloader
         self.test_dataloader = test_dataloader
@@ -13,6 +17,26 @@ class Trainer(ABC):
         self.optimizer = optimizer
         self.task = task
 
+    @staticmethod
+    def compute_auc(targets: list, preds: list) -> float:
+        """
+        Compute the epoch AUC from the accumulated prediction tensors
+
+        Concatenates the per-batch device tensors and moves them to the host
+        in a single transfer, so the metric cost sits entirely outside the
+        batch loop.
+
+        Args:
+            targets (list): Per-batch target tensors
+            preds (list): Per-batch prediction tensors
+
+        Returns:
+            float: Area under the curve
+        """
+        targets = torch.cat(targets).float().cpu().numpy()
+        preds = torch.cat(preds).float().cpu().numpy()
+        return metrics.roc_auc_score(targets, preds)
+
     @staticmethod
     def log_metrics(auc: float, accuracy: float, loss: float, current_epoch_nr: int, metric_type: str) -> None:
         """